@@ -1,30 +1,117 @@
 import os
-import json
+import time
+import random
 import base64
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, status
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 import httpx
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Zoom Scheduler Bridge", version="1.0.0")
+logger = logging.getLogger("zoom_bridge")
+
+# Use uvloop's faster event loop when the server is launched externally
+# (e.g. `uvicorn main:app`); harmless no-op where uvloop is unavailable
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage the shared HTTP client for the application lifetime.
+
+    A single AsyncClient is created at startup and reused for all Zoom
+    calls so the event loop is never blocked waiting on Zoom responses.
+    Keep-alive pooling and HTTP/2 let consecutive requests reuse the
+    same connection instead of paying a TCP + TLS handshake each time.
+    Credentials are validated here so a misconfigured deployment fails
+    at startup instead of serving a 500 for every meeting request.
+    """
+    if not _CREDENTIALS_OK:
+        raise RuntimeError(
+            "Zoom credentials not configured - set ZOOM_CLIENT_ID, "
+            "ZOOM_CLIENT_SECRET and ZOOM_ACCOUNT_ID"
+        )
+
+    transport = httpx.AsyncHTTPTransport(
+        retries=2,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=128,
+            keepalive_expiry=60.0
+        )
+    )
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        transport=transport
+    )
+    yield
+    await app.state.http.aclose()
+
+
+app = FastAPI(
+    title="Zoom Scheduler Bridge",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # CORS Configuration
-# Allow all origins for Google AI Studio Prototype compatibility
+# The wildcard default keeps Google AI Studio Prototype compatibility;
+# set FRONTEND_URL (comma-separated) to pin known origins. Credentials
+# are only allowed with an explicit allowlist — browsers reject the
+# "*" + credentials combination anyway, and turning them off lets the
+# middleware skip its credential branches. Only the methods/headers
+# this service actually accepts are listed, and browsers may cache the
+# preflight for a day.
+_CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("FRONTEND_URL", "*").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_CORS_ORIGINS,
+    allow_credentials="*" not in _CORS_ORIGINS,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
+# Optional profiling: run with PROFILE=1 to wrap every request in
+# pyinstrument and write the latest flame chart to profile.html, so
+# optimization work targets the measured hot path. Off by default and
+# never enabled in production.
+if os.getenv("PROFILE") == "1":
+    from pyinstrument import Profiler
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        response = await call_next(request)
+        profiler.stop()
+        with open("profile.html", "w") as f:
+            f.write(profiler.output_html())
+        return response
+
 # Zoom Credentials
 ZOOM_CLIENT_ID = os.getenv("ZOOM_CLIENT_ID")
 ZOOM_CLIENT_SECRET = os.getenv("ZOOM_CLIENT_SECRET")
@@ -37,10 +124,12 @@ ZOOM_API_BASE_URL = "https://api.zoom.us/v2"
 # ==================== Request Models ====================
 
 class CreateMeetingRequest(BaseModel):
-    candidate_name: str
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+    candidate_name: str = Field(min_length=1, max_length=256)
     user_email: EmailStr
-    start_time: str  # ISO 8601 format: "2025-12-20T10:00:00"
-    duration: int  # Duration in minutes
+    start_time: datetime  # ISO 8601 format: "2025-12-20T10:00:00"
+    duration: int = Field(gt=0, le=1440)  # Duration in minutes, max 24h
 
 
 class MeetingResponse(BaseModel):
@@ -52,73 +141,218 @@ class MeetingResponse(BaseModel):
     topic: str
 
 
+# ==================== HTTP Helpers ====================
+
+# Transient Zoom failures worth retrying; 4xx client errors (other
+# than 429) are never retried.
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_RETRY_MAX_ATTEMPTS = 3
+_RETRY_INITIAL_DELAY = 0.1  # seconds, doubled per attempt with jitter
+_RETRY_MAX_DELAY = 2.0
+
+
+async def _timed_post(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """POST and log the Zoom round-trip latency for this one call."""
+    t0 = time.perf_counter()
+    response = await client.post(url, **kwargs)
+    logger.info(
+        "zoom.call url=%s status=%s ms=%.1f",
+        url,
+        response.status_code,
+        (time.perf_counter() - t0) * 1000
+    )
+    return response
+
+
+async def post_with_retry(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """
+    POST to Zoom with bounded retries on transient failures.
+
+    Connect-level errors are already retried inside the transport; this
+    adds up to two application-level retries for 429/5xx responses with
+    exponential backoff plus jitter, honouring Zoom's Retry-After header
+    when present (capped at 2 seconds). Other 4xx responses return
+    immediately. Each attempt's latency is logged so we can see whether
+    OAuth or meeting creation dominates the request time.
+
+    Args:
+        client: Shared async HTTP client
+        url: Target URL
+        **kwargs: Passed through to client.post
+
+    Returns:
+        httpx.Response: The final response (not yet status-checked)
+    """
+    delay = _RETRY_INITIAL_DELAY
+
+    for attempt in range(_RETRY_MAX_ATTEMPTS):
+        response = await _timed_post(client, url, **kwargs)
+
+        if response.status_code not in _RETRYABLE_STATUS_CODES:
+            break
+        if attempt == _RETRY_MAX_ATTEMPTS - 1:
+            break
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            wait = min(float(retry_after), _RETRY_MAX_DELAY)
+        else:
+            wait = min(delay + random.uniform(0, delay), _RETRY_MAX_DELAY)
+        await asyncio.sleep(wait)
+        delay *= 2
+
+    return response
+
+
 # ==================== Zoom OAuth Logic ====================
 
-def get_zoom_access_token() -> str:
+# The credentials are immutable for the process lifetime, so check them
+# once at import and build the Basic auth header and OAuth request
+# bodies up front instead of re-evaluating per token fetch.
+_CREDENTIALS_OK = bool(ZOOM_CLIENT_ID and ZOOM_CLIENT_SECRET and ZOOM_ACCOUNT_ID)
+
+if _CREDENTIALS_OK:
+    _BASIC_AUTH_HEADER = "Basic " + base64.b64encode(
+        f"{ZOOM_CLIENT_ID}:{ZOOM_CLIENT_SECRET}".encode()
+    ).decode()
+else:
+    _BASIC_AUTH_HEADER = None
+
+_OAUTH_HEADERS = {
+    "Authorization": _BASIC_AUTH_HEADER,
+    "Content-Type": "application/x-www-form-urlencoded"
+}
+
+_OAUTH_PAYLOAD = {
+    "grant_type": "account_credentials",
+    "account_id": ZOOM_ACCOUNT_ID
+}
+
+_TOKEN_FAIL_DETAIL = "Failed to get Zoom access token: "
+
+# Token cache: Zoom Server-to-Server tokens are valid for ~1 hour, so
+# reuse the token across requests and refresh it 60 seconds early. The
+# Bearer headers dict is cached with the token so API calls don't
+# rebuild it per request; both are invalidated together.
+_token: Optional[str] = None
+_token_expiry: float = 0.0
+_auth_headers: Optional[dict] = None
+_token_lock = asyncio.Lock()
+
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry to fetch a new token
+
+
+def invalidate_zoom_token() -> None:
+    """Drop the cached token so the next call fetches a fresh one."""
+    global _token, _token_expiry, _auth_headers
+    _token = None
+    _token_expiry = 0.0
+    _auth_headers = None
+
+
+async def get_zoom_access_token(client: httpx.AsyncClient) -> str:
     """
     Get Zoom Server-to-Server OAuth Access Token.
-    
+
     This function uses the Zoom account credentials to authenticate
-    and retrieve an access token for API calls.
-    
+    and retrieve an access token for API calls. Tokens are cached
+    in-process and reused until shortly before they expire, so the
+    OAuth round-trip only happens roughly once an hour.
+
+    Args:
+        client: Shared async HTTP client
+
     Returns:
         str: Access token for Zoom API
-        
+
     Raises:
         HTTPException: If token retrieval fails
     """
-    if not all([ZOOM_CLIENT_ID, ZOOM_CLIENT_SECRET, ZOOM_ACCOUNT_ID]):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Zoom credentials not configured"
-        )
-    
-    # Create authorization header (Base64 encoded client_id:client_secret)
-    credentials = f"{ZOOM_CLIENT_ID}:{ZOOM_CLIENT_SECRET}"
-    encoded_credentials = base64.b64encode(credentials.encode()).decode()
-    
-    headers = {
-        "Authorization": f"Basic {encoded_credentials}",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    
-    payload = {
-        "grant_type": "account_credentials",
-        "account_id": ZOOM_ACCOUNT_ID
-    }
-    
-    try:
-        response = httpx.post(
-            ZOOM_OAUTH_URL,
-            headers=headers,
-            data=payload,
-            timeout=10.0
-        )
-        response.raise_for_status()
-        
-        token_data = response.json()
-        return token_data["access_token"]
-    
-    except httpx.HTTPError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get Zoom access token: {str(e)}"
-        )
+    global _token, _token_expiry, _auth_headers
+
+    if _token and time.monotonic() < _token_expiry - TOKEN_REFRESH_MARGIN:
+        return _token
+
+    async with _token_lock:
+        # Another request may have refreshed the token while we waited
+        if _token and time.monotonic() < _token_expiry - TOKEN_REFRESH_MARGIN:
+            return _token
+
+        try:
+            response = await post_with_retry(
+                client,
+                ZOOM_OAUTH_URL,
+                headers=_OAUTH_HEADERS,
+                data=_OAUTH_PAYLOAD
+            )
+            response.raise_for_status()
+
+            token_data = orjson.loads(response.content)
+            _token = token_data["access_token"]
+            _token_expiry = time.monotonic() + token_data.get("expires_in", 3600)
+            _auth_headers = {
+                "Authorization": "Bearer " + _token,
+                "Content-Type": "application/json"
+            }
+            return _token
+
+        except httpx.HTTPError as e:
+            invalidate_zoom_token()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=_TOKEN_FAIL_DETAIL + str(e)
+            ) from e
+
+
+async def get_zoom_auth_headers(client: httpx.AsyncClient) -> dict:
+    """
+    Get the Bearer headers for Zoom API calls.
+
+    The headers dict is built when the token is minted and cached with
+    it, so warm requests reuse the same dict object.
+
+    Args:
+        client: Shared async HTTP client
+
+    Returns:
+        dict: Authorization and Content-Type headers
+
+    Raises:
+        HTTPException: If token retrieval fails
+    """
+    await get_zoom_access_token(client)
+    return _auth_headers
 
 
 # ==================== Zoom Meeting Creation ====================
 
-def create_zoom_meeting(
-    access_token: str,
+# Constant string fragments, hoisted so the hot path only does a concat
+_TOPIC_PREFIX = "Interview with "
+_MEETING_FAIL_DETAIL = "Failed to create Zoom meeting: "
+
+# Default interview meeting settings, built once instead of per call
+_MEETING_DEFAULT_SETTINGS = {
+    "join_before_host": True,
+    "waiting_room": False,
+    "host_video": True,
+    "participant_video": True
+}
+
+
+async def create_zoom_meeting(
+    client: httpx.AsyncClient,
+    auth_headers: dict,
     candidate_name: str,
     start_time: str,
     duration: int
 ) -> dict:
     """
     Create a scheduled Zoom meeting using the Zoom API.
-    
+
     Args:
-        access_token: Zoom OAuth access token
+        client: Shared async HTTP client
+        auth_headers: Cached Bearer headers from get_zoom_auth_headers
         candidate_name: Name of the interview candidate
         start_time: Meeting start time (ISO 8601 format)
         duration: Meeting duration in minutes
@@ -129,34 +363,24 @@ def create_zoom_meeting(
     Raises:
         HTTPException: If meeting creation fails
     """
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-    
     meeting_payload = {
-        "topic": f"Interview with {candidate_name}",
+        "topic": _TOPIC_PREFIX + candidate_name,
         "type": 2,  # Scheduled Meeting
         "start_time": start_time,
         "duration": duration,
-        "settings": {
-            "join_before_host": True,
-            "waiting_room": False,
-            "host_video": True,
-            "participant_video": True
-        }
+        "settings": _MEETING_DEFAULT_SETTINGS
     }
     
     try:
-        response = httpx.post(
+        response = await post_with_retry(
+            client,
             f"{ZOOM_API_BASE_URL}/users/me/meetings",
-            headers=headers,
-            json=meeting_payload,
-            timeout=10.0
+            headers=auth_headers,
+            content=orjson.dumps(meeting_payload)
         )
         response.raise_for_status()
-        
-        meeting_data = response.json()
+
+        meeting_data = orjson.loads(response.content)
         
         return {
             "join_url": meeting_data.get("join_url"),
@@ -167,23 +391,44 @@ def create_zoom_meeting(
             "topic": meeting_data.get("topic")
         }
     
+    except httpx.HTTPStatusError as e:
+        # A 401 means Zoom rejected the cached token (e.g. revoked early);
+        # drop it so the caller can retry with a fresh one
+        if e.response.status_code == status.HTTP_401_UNAUTHORIZED:
+            invalidate_zoom_token()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=_MEETING_FAIL_DETAIL + str(e)
+        ) from e
+
     except httpx.HTTPError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create Zoom meeting: {str(e)}"
-        )
+            detail=_MEETING_FAIL_DETAIL + str(e)
+        ) from e
 
 
 # ==================== API Endpoints ====================
 
+# Health and status payloads are constant after startup, so serialize
+# them once and return the pre-encoded bytes; load balancers can hit
+# these endpoints many times per second.
+_HEALTH_BODY = orjson.dumps({
+    "status": "OK",
+    "service": "Zoom Scheduler Bridge",
+    "version": "1.0.0"
+})
+
+_STATUS_BODY = orjson.dumps({
+    "credentials_configured": _CREDENTIALS_OK,
+    "cors_enabled": ", ".join(_CORS_ORIGINS)
+})
+
+
 @app.get("/", tags=["Health"])
 def health_check():
     """Health check endpoint"""
-    return {
-        "status": "OK",
-        "service": "Zoom Scheduler Bridge",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.post(
@@ -192,7 +437,7 @@ def health_check():
     tags=["Zoom"],
     summary="Create a Zoom Interview Meeting"
 )
-async def create_meeting(request: CreateMeetingRequest) -> MeetingResponse:
+async def create_meeting(request: CreateMeetingRequest) -> ORJSONResponse:
     """
     Create a scheduled Zoom meeting for a candidate interview.
     
@@ -211,26 +456,29 @@ async def create_meeting(request: CreateMeetingRequest) -> MeetingResponse:
         HTTPException: If Zoom authentication or API call fails
     """
     try:
-        # Step 1: Get Zoom access token
-        access_token = get_zoom_access_token()
+        # Steps 1-2: Get the (cached) auth headers and create the meeting,
+        # retrying once with a fresh token if Zoom rejected the cached one
+        for is_retry in (False, True):
+            auth_headers = await get_zoom_auth_headers(app.state.http)
+            try:
+                meeting_details = await create_zoom_meeting(
+                    client=app.state.http,
+                    auth_headers=auth_headers,
+                    candidate_name=request.candidate_name,
+                    start_time=request.start_time.isoformat(),
+                    duration=request.duration
+                )
+                break
+            except HTTPException:
+                if is_retry or _token is not None:
+                    raise
         
-        # Step 2: Create meeting via Zoom API
-        meeting_details = create_zoom_meeting(
-            access_token=access_token,
-            candidate_name=request.candidate_name,
-            start_time=request.start_time,
-            duration=request.duration
-        )
-        
-        # Step 3: Return formatted response
-        return MeetingResponse(
-            join_url=meeting_details["join_url"],
-            meeting_id=str(meeting_details["meeting_id"]),
-            password=meeting_details["password"],
-            start_time=meeting_details["start_time"],
-            duration=meeting_details["duration"],
-            topic=meeting_details["topic"]
-        )
+        # Step 3: Return the details directly. We built this dict
+        # ourselves, so a pre-constructed response skips FastAPI's
+        # redundant response_model validation pass while the decorator's
+        # response_model still documents the schema.
+        meeting_details["meeting_id"] = str(meeting_details["meeting_id"])
+        return ORJSONResponse(meeting_details)
     
     except HTTPException:
         raise
@@ -238,7 +486,7 @@ async def create_meeting(request: CreateMeetingRequest) -> MeetingResponse:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error: {str(e)}"
-        )
+        ) from e
 
 
 # ==================== Additional Endpoints ====================
@@ -246,23 +494,22 @@ async def create_meeting(request: CreateMeetingRequest) -> MeetingResponse:
 @app.get("/api/zoom/status", tags=["Zoom"])
 def zoom_status():
     """Check if Zoom credentials are configured"""
-    credentials_configured = all([
-        ZOOM_CLIENT_ID,
-        ZOOM_CLIENT_SECRET,
-        ZOOM_ACCOUNT_ID
-    ])
-    
-    return {
-        "credentials_configured": credentials_configured,
-        "cors_enabled": "All origins (Google AI Studio compatible)"
-    }
+    return Response(content=_STATUS_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
+
+    # Each worker gets its own event loop, HTTP pool, and token cache;
+    # Zoom allows concurrent Server-to-Server tokens, so per-worker
+    # caches are fine. Workers and auto-reload are mutually exclusive.
+    debug = os.getenv("DEBUG", "False") == "True"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=os.getenv("DEBUG", "False") == "True"
+        loop="uvloop",
+        http="httptools",
+        workers=1 if debug else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+        reload=debug
     )